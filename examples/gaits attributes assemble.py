@@ -51,17 +51,19 @@ params_model_outputs = [
 ]
 
 # load subjects data and export the assembled parameters
-subjects = data.load(
-    folder='viconProbe/subjects', 
-    batches=['Model Outputs'], 
-    vicon_data_class=data.ViconData_interp, 
-    point_num=100,
-    threshold_num=50
-)
+# the main guard is required since data.load() parses the documents in worker processes
+if __name__ == '__main__':
+    subjects = data.load(
+        folder='viconProbe/subjects', 
+        batches=['Model Outputs'], 
+        vicon_data_class=data.ViconData_interp, 
+        point_num=100,
+        threshold_num=50
+    )
 
-export.export_gait_attrs(
-    subjects=subjects,
-    batch='Model Outputs', 
-    params=params_model_outputs,
-    export_folder='viconProbe/outputs',
-)
\ No newline at end of file
+    export.export_gait_attrs(
+        subjects=subjects,
+        batch='Model Outputs', 
+        params=params_model_outputs,
+        export_folder='viconProbe/outputs',
+    )
\ No newline at end of file
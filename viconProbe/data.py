@@ -1,12 +1,28 @@
 from __future__ import annotations
 from typing import Type, Union, Iterable
 
+import io
 import os
+import sys
 import re
-import math
+import csv
+import hashlib
+import importlib.util
+import pickle
+import tempfile
+import zipfile
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import numpy as np
 import pandas as pd
-from scipy import interpolate
+
+# numba is only imported when ViconData_interp first resamples data, so other processes don't pay for its import
+# it's set to False if numba fails to be imported then
+HAS_NUMBA = importlib.util.find_spec('numba') is not None
+
+CACHE_SUFFIX = '.cache.npz'
+
 
 class ViconData(object):
     """The basic Vicon data class.
@@ -24,7 +40,9 @@ class ViconData(object):
 
         Warning
         ---
-        Since different data batches in the :code:`.csv` files exported from Vicon have different column numbers, the number of columns to be loaded needs to be manually set. :attr:`max_col` is set as :code:`500` in default and needs to be carefully revised if necessary.
+        Since different data batches in the :code:`.csv` files exported from Vicon have different column numbers, the number of header columns to be loaded is taken from the widest header line of the file when :attr:`max_col` is left as :code:`None` in default. Set it manually only to load fewer columns.
+    cache
+        if :code:`True`, the parsed :attr:`self.attrs` and :attr:`self.timestamps` are saved to :code:`<path>.cache.npz`, and restored from it in later initialisations, as long as it's newer than the :code:`.csv` document and was saved with the same Vicon data class and parameters. Stale caches can be removed with :func:`clear_cache`.
 
     Note
     ---
@@ -32,10 +50,10 @@ class ViconData(object):
     
     self.path
         path of the exported :code:`.csv` Vicon analysis documents.
-    self.df
-        :class:`pandas.DataFrame` loaded from :code:`.csv` Vicon analysis documents.
+    self.cache_path
+        path of the cache file.
     self.attrs
-        :class:`dict` of data batches. For example: ::
+        :class:`dict` of data batches stored as :class:`GaitBatch`. For example: ::
 
             self.attrs['Joints']
             self.attrs['Model Outputs']
@@ -44,31 +62,150 @@ class ViconData(object):
 
             [(gait_1_start_time, gait_1_end_time), (gait_2_start_time, gait_2_end_time), ...]
     """
-    def __init__(self, path: str, batches: list, max_col: int = 500, **kwargs):
+    def __init__(self, path: str, batches: list, max_col: int = None, cache: bool = False, **kwargs):
         self.path = path
 
-        # inactivate low_memory due to mixture data type
-        try:
-            self.df = pd.read_csv(
-                self.path, 
-                names=[n for n in range(max_col)],
-                low_memory=False
-            )
-        
-        # sometimes it raise issue, in this case activate low_memory
-        except:
-            self.df = pd.read_csv(
-                self.path, 
-                names=[n for n in range(max_col)],
-                low_memory=True
-            )
+        # the cached data is only valid for the same class and parameters, including the ones set by subclasses
+        config = repr((type(self).__name__, batches, max_col, sorted(vars(self).items())))
+        self.cache_path = self.path + CACHE_SUFFIX
+
+        if cache and self.cache_load(config):
+            return
 
+        self.header_scan(max_col)
         self.gait_retrieve()
         self.attrs = {}
 
         for batch in batches:
             self.attrs[batch] = self.batch_retrieve(batch)
 
+        if cache:
+            self.cache_save(config)
+
+    def cache_load(self, config: str) -> bool:
+        """Restore :attr:`self.attrs` and :attr:`self.timestamps` from :attr:`self.cache_path`.
+
+        Parameters
+        ---
+        config
+            representation of the Vicon data class and parameters that the cache must be saved with.
+
+        Returns
+        ---
+        :class:`bool`
+            whether the cache is valid and restored.
+        """
+        if not os.path.isfile(self.cache_path) or os.path.getmtime(self.cache_path) < os.path.getmtime(self.path):
+            return False
+
+        # a cache left unreadable, e.g. by an interrupted run, is parsed again as a missing one
+        try:
+            with np.load(self.cache_path, allow_pickle=True) as cache:
+                if cache['config'].item() != config:
+                    return False
+
+                timestamps = [tuple(t) for t in cache['timestamps'].tolist()]
+                attrs = cache['attrs'].item()
+
+        except (zipfile.BadZipFile, EOFError, KeyError, pickle.UnpicklingError, ValueError):
+            return False
+
+        self.timestamps = timestamps
+        self.attrs = attrs
+        return True
+
+    def cache_save(self, config: str):
+        """Save :attr:`self.attrs` and :attr:`self.timestamps` to :attr:`self.cache_path`.
+
+        Parameters
+        ---
+        config
+            representation of the Vicon data class and parameters, checked by :meth:`cache_load`.
+        """
+        attrs = np.empty((), dtype=object)
+        attrs[()] = self.attrs
+
+        # the cache is written to a temporary file and then moved into place, so an interrupted run never leaves a truncated cache
+        # the temporary file also ends with the cache suffix, so that it's skipped by load() and removed by clear_cache()
+        fd, temp_path = tempfile.mkstemp(suffix=CACHE_SUFFIX, dir=os.path.dirname(os.path.abspath(self.cache_path)))
+
+        try:
+            # pass an opened file, otherwise numpy appends another .npz suffix
+            with os.fdopen(fd, 'wb') as file:
+                np.savez(
+                    file,
+                    config=np.array(config),
+                    timestamps=np.asarray(self.timestamps, dtype=np.float64).reshape(-1, 2),
+                    attrs=attrs,
+                )
+
+            os.replace(temp_path, self.cache_path)
+
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def header_scan(self, max_col: int = None):
+        """Scan the :code:`.csv` document line by line, keeping the header rows and locating the data rows of every batch, without parsing the data rows.
+
+        - A section of the document ends with a blank line.
+        - A batch is a section starting with its name, output rate, parameter, sub-parameter, and unit rows, followed by its data rows.
+        - All rows excepting the batches' data rows are deemed header rows, e.g. the :code:`Events` section.
+
+        Parameters
+        ---
+        max_col
+            the number of header columns to be loaded. If :code:`None`, it's taken from the widest header row.
+
+        Note
+        ---
+        The header rows are stored in :attr:`self._header` as a :class:`numpy.ndarray` of :class:`str`, with the empty cells as :code:`NaN`. The byte ranges of the batches' data rows are stored in :attr:`self._sections`, keyed by the header row index of the batch name. The data rows are parsed in :meth:`batch_retrieve`, and only kept as the :class:`GaitBatch` of the batch.
+        """
+        rows = []
+        self._sections = {}
+
+        # header row index of the current section's first row, and byte offset of its data rows
+        section = None
+        data_start = None
+        offset = 0
+
+        with open(self.path, 'rb') as file:
+            for line in file:
+                if not line.strip(b' ,\r\n'):
+                    if data_start is not None:
+                        self._sections[section] = (data_start, offset)
+
+                    section = None
+                    data_start = None
+
+                elif data_start is None:
+                    if section is None:
+                        section = len(rows)
+
+                    rows.append(next(csv.reader([line.decode('utf-8-sig')])))
+
+                    # the output rate row of a batch holds a single integer
+                    if len(rows) - section == 5:
+                        cells = [v for v in rows[section + 1] if v]
+
+                        if len(cells) == 1 and cells[0].isdigit():
+                            data_start = offset + len(line)
+
+                offset += len(line)
+
+        if data_start is not None:
+            self._sections[section] = (data_start, offset)
+
+        if max_col is None:
+            max_col = max(map(len, rows), default=0)
+
+        self._header = np.full((len(rows), max_col), np.nan, dtype=object)
+
+        for n, row in enumerate(rows):
+            for m, v in enumerate(row[:max_col]):
+                if v:
+                    self._header[n, m] = v
+
     def gait_retrieve(self):
         """Retrieve the gait timestamp to :attr:`self.gaites` in the format of :code:`[(gait_1_start_time, gait_1_end_time), (gait_2_start_time, gait_2_end_time), ...]`.
         
@@ -76,18 +213,13 @@ class ViconData(object):
         ---
         Every pair of :code:`Foot Strike` is deemed the start and end of a gait, regardless of what is before, after, and inserted between them.
         """
-        events_indexes = df_match_indexes(self.df, 'Foot Strike')
-        events_rows = events_indexes[0]
-        events_cols = events_indexes[1]
-
-        self.timestamps = []
-        for n in range(0, int(len(events_rows)), 2):
-            self.timestamps.append((
-                float(self.df.loc[events_rows[n], events_cols[n] + 1]),
-                float(self.df.loc[events_rows[n + 1], events_cols[n] + 1]),
-            ))
-
-    def batch_retrieve(self, batch: str) -> list:
+        # the events are listed with their names in the 3rd column and times in the 4th column
+        rows = df_match_col2(self._header, 'Foot Strike')
+        starts = self._header[rows[0::2], 3].astype(float)
+        ends = self._header[rows[1::2], 3].astype(float)
+        self.timestamps = list(zip(starts.tolist(), ends.tolist()))
+
+    def batch_retrieve(self, batch: str) -> GaitBatch:
         """Retrieve all parameters that belongs to different gaits from a batch of data.
         
         Parameters
@@ -97,62 +229,126 @@ class ViconData(object):
         
         Returns
         ---
-        :class:`list`
-            a list of dictionary, each stores the parameters that belongs to a gait, with the same order of :code:`self.timestamps`. In summary, to retrieve a piece of data: ::
+        :class:`GaitBatch`
+            the parameters of all gaits, with the same order of :code:`self.timestamps`. Each piece of data is a :code:`float64` :class:`numpy.ndarray`. In summary, to retrieve a piece of data: ::
             
                 return_var[gait_idx][param_name][sub_param_name]
-        """
-        row_start = df_first_match_row(self.df, batch) + 5
-        frame_start = int(self.df.loc[row_start, 0])
-        output_rate = int(self.df.loc[row_start - 4, 0])
-
-        def time2row(time: float) -> int:
-            """Transform a time value to the row index in :attr:`self.df`."""
-            frame = time * output_rate
-            row = int(row_start + frame - frame_start)
-            if row < row_start:
-                print("Invalid time value: {}".format(time))
-            else:
-                return row
-
-        def gait_extract(start: int, end: int, col_name: str) -> list:
-            """Extract the data of :code:`col_name` column from the :code:`start` row to the :code:`end` row."""
-            data = self.df.loc[time2row(start): time2row(end), col_name].tolist()
-            return self.data_process(data)
 
-        param_list = self.df.loc[row_start - 3, :].tolist()
-        sub_param_list = self.df.loc[row_start - 2, :].tolist()
+            :code:`None` with a warning printed, if the batch isn't found or its data isn't numeric. A gait whose time is before the batch's first frame is left with empty data, with a warning printed.
+        """
+        # the batch name may also appear in other header rows, e.g. the events' subject
+        section = next((n for n in df_match_col0(self._header, batch) if n in self._sections), None)
 
-        gaits = [{} for n in range(len(self.timestamps))]
+        if section is None:
+            print("Warning: {} not found in {}".format(batch, self.path))
+            return
 
-        try:
-            for n in range(2, len(param_list)):
-                if type(param_list[n]) == str:
-                    param_name = param_list[n].split(':')[1]
+        output_rate = int(self._header[section + 1, 0])
+        param_list = self._header[section + 2].tolist()
+        sub_param_list = self._header[section + 3].tolist()
 
-                    for gait in gaits:
-                        gait[param_name] = {}
+        is_sub_param = np.fromiter((isinstance(v, str) for v in sub_param_list), dtype=bool, count=len(sub_param_list))
 
-                if type(sub_param_list[n]) == str:
-                    sub_param_name = sub_param_list[n]
+        # the first two columns are frame and sub frame
+        is_sub_param[:2] = False
 
-                    for m in range(len(gaits)):
-                        event_data = gait_extract(self.timestamps[m][0], self.timestamps[m][1], n)
-                        event_data = list(map(float, event_data))
-                        gaits[m][param_name][sub_param_name] = event_data
+        if not is_sub_param.any():
+            print("Warning: no parameter found in {} of {}".format(batch, self.path))
+            return
 
-            return gaits
-        
-        except:
-            print("Warning: unexpected error happens when parsing {}".format(self.path))
+        # only the data rows of the batch are parsed
+        data_start, data_end = self._sections[section]
 
-    def data_process(self, data: list) -> list:
+        # the data rows are purely numeric, so they're parsed as float64 directly
+        # the columns are named after the header width, so that rows with the trailing empty cells trimmed are padded with NaN
+        try:
+            with open(self.path, 'rb') as file:
+                file.seek(data_start)
+                data = _read_csv(
+                    io.BytesIO(file.read(data_end - data_start)),
+                    header=None,
+                    names=range(len(param_list)),
+                    dtype=np.float64,
+                    na_values=[''],
+                ).to_numpy()
+
+        # both are subclasses of ValueError
+        except (pd.errors.ParserError, pd.errors.EmptyDataError):
+            print("Warning: malformed data rows found when parsing {} of {}".format(batch, self.path))
+            return
+
+        except ValueError:
+            print("Warning: non-numeric data found when parsing {} of {}".format(batch, self.path))
+            return
+
+        frame_start = int(data[0, 0])
+
+        # row indexes of every gait's start and end, transformed from the time values at once
+        times = np.asarray(self.timestamps, dtype=np.float64).reshape(-1, 2)
+        row_ranges = (times * output_rate - frame_start).astype(int)
+
+        for time in times[row_ranges < 0]:
+            print("Invalid time value: {}".format(time))
+
+        # gaits starting or ending before the data rows are left empty, since negative indexes would slice from the end
+        row_ranges[(row_ranges < 0).any(axis=1)] = (0, -1)
+
+        ncols = np.flatnonzero(is_sub_param)[-1] + 1
+        is_param = np.fromiter((isinstance(v, str) for v in param_list[:ncols]), dtype=bool, count=ncols)
+        is_param[:2] = False
+        blocks = [data[row0:row1 + 1, :ncols] for row0, row1 in row_ranges]
+
+        # every sub-parameter column belongs to the nearest parameter column on its left
+        param_cols = np.flatnonzero(is_param)
+        param_names = {}
+        owners = np.maximum.accumulate(np.where(is_param, np.arange(ncols), -1))
+
+        # parameter names are formatted as subject:parameter, the subject is optional
+        # names are interned since they're looked up as dictionary keys for every gait
+        for n in param_cols:
+            subject, colon, param_name = param_list[n].partition(':')
+            param_names[n] = sys.intern(param_name if colon else subject)
+
+        sub_param_index = {param_names[n]: {} for n in param_cols}
+        sub_param_cols = {param_names[n]: [] for n in param_cols}
+
+        # sub-parameters without a parameter on their left are skipped
+        for n in np.flatnonzero(is_sub_param[:ncols] & (owners >= 0)):
+            param_name = param_names[owners[n]]
+            sub_param_index[param_name][sys.intern(sub_param_list[n])] = len(sub_param_cols[param_name])
+            sub_param_cols[param_name].append(n)
+
+        values = {}
+        lengths = {}
+
+        for param_name, cols in sub_param_cols.items():
+            # the data of all gaits and sub-parameters are flattened into a single list, in the order of the array's first two axes
+            # no copy is made if it's already a float64 array
+            param_data = [np.asarray(self.data_process(block[:, n]), dtype=np.float64) for block in blocks for n in cols]
+
+            length = np.fromiter((d.size for d in param_data), dtype=int, count=len(param_data))
+            value = np.full((length.size, length.max(initial=0)), np.nan)
+
+            for i, d in enumerate(param_data):
+                value[i, :d.size] = d
+
+            values[param_name] = value.reshape(len(blocks), len(cols), value.shape[1])
+            lengths[param_name] = length.reshape(len(blocks), len(cols))
+
+        return GaitBatch(len(blocks), values, lengths, sub_param_index)
+
+    def data_process(self, data: np.ndarray) -> np.ndarray:
         """Post-processing of data.
 
         Parameters
         ---
         data
-            Input gait's parameter data.
+            Input gait's parameter data, a :class:`numpy.ndarray` of :code:`float64`.
+
+        Returns
+        ---
+        :class:`numpy.ndarray`
+            the processed data. Other array-like returns of overriding methods are converted to :code:`float64` arrays in :meth:`batch_retrieve`.
         
         Attention
         ---
@@ -185,7 +381,7 @@ class ViconData_interp(ViconData):
         self.threshold_num = threshold_num
         ViconData.__init__(self, **kwargs)
 
-    def data_process(self, data: list) -> list:
+    def data_process(self, data: np.ndarray) -> np.ndarray:
         """resample the input data to the same length.
 
         - Remove all :code:`NaN` in the original data.
@@ -195,34 +391,221 @@ class ViconData_interp(ViconData):
         ---
         data
             Input gait's parameter data.
+
+        Returns
+        ---
+        :class:`numpy.ndarray`
+            the resampled :code:`float64` data, or the valid data points if they are too few to be resampled.
         """
-        try:
-            data_remove_nan = [d for d in data if math.isnan(float(d)) == False]
-        except:
-            print(data)
+        data = np.asarray(data, dtype=np.float64)
+
+        # short data is dominated by the overheads of numpy calls, which the compiled kernel skips
+        if HAS_NUMBA and data.size <= _KERNEL_MAX_LEN:
+            kernel = _compiled_filter_resample()
+
+            if kernel is not None:
+                return kernel(data, self.point_num, max(self.threshold_num, 2))
 
-        if len(data_remove_nan) < self.threshold_num or len(data_remove_nan) < 2:
+        data_remove_nan = data[~np.isnan(data)]
+
+        if data_remove_nan.size < self.threshold_num or data_remove_nan.size < 2:
             return data_remove_nan
-        else:
-            interpolate_kind = 'slinear'
 
-        func_interp = interpolate.interp1d(range(len(data_remove_nan)),
-                                           data_remove_nan,
-                                           kind=interpolate_kind)
+        # short data is cheaper to be resampled again than to be hashed
+        if data_remove_nan.size <= _RESAMPLE_CACHE_MIN_LEN:
+            return _resample(data_remove_nan, self.point_num)
+
+        key = (hashlib.blake2b(data_remove_nan.tobytes(), digest_size=16).digest(), self.point_num)
+
+        if key in _resample_cache:
+            _resample_cache.move_to_end(key)
+            return _resample_cache[key]
 
-        x_new = np.linspace(0, len(data_remove_nan) - 1, self.point_num)
-        data_new = func_interp(x_new)
+        # the cached array is shared by later hits, so it's made read-only
+        data_new = _resample(data_remove_nan, self.point_num)
+        data_new.flags.writeable = False
+        _resample_cache[key] = data_new
+
+        if len(_resample_cache) > _RESAMPLE_CACHE_SIZE:
+            _resample_cache.popitem(last=False)
 
         return data_new
 
 
-def df_match_indexes(df: pd.DataFrame, symbol: str) -> tuple:
+# resampled data of the recently seen inputs, shared by all ViconData_interp instances in the process
+_resample_cache = OrderedDict()
+_RESAMPLE_CACHE_SIZE = 512
+_RESAMPLE_CACHE_MIN_LEN = 256
+
+# the longest data resampled by the compiled kernel, longer data is faster in numpy calls
+_KERNEL_MAX_LEN = 256
+
+
+def _resample(data: np.ndarray, point_num: int) -> np.ndarray:
+    """Linearly resample :code:`data` to :code:`point_num` points."""
+    x = np.arange(data.size, dtype=np.float64)
+    x_new = np.linspace(0, data.size - 1, point_num)
+    return np.interp(x_new, x, data)
+
+
+def _filter_resample(data: np.ndarray, point_num: int, min_num: int) -> np.ndarray:
+    """Remove :code:`NaN` from :code:`data` and linearly resample it to :code:`point_num` points, in the same loops. If fewer than :code:`min_num` valid points remain, they are returned without resampling.
+
+    Attention
+    ---
+    :code:`min_num` must be at least :code:`2`. It's compiled by :mod:`numba` in :func:`_compiled_filter_resample`.
+    """
+    valid = np.empty(data.size)
+    n = 0
+
+    for i in range(data.size):
+        v = data[i]
+
+        # NaN is the only value unequal to itself
+        if v == v:
+            valid[n] = v
+            n += 1
+
+    if n < min_num:
+        return valid[:n].copy()
+
+    out = np.empty(point_num)
+    step = (n - 1) / (point_num - 1) if point_num > 1 else 0.0
+
+    for j in range(point_num):
+        x = j * step
+        i = min(int(x), n - 2)
+        out[j] = valid[i] + (valid[i + 1] - valid[i]) * (x - i)
+
+    return out
+
+
+_filter_resample_jit = None
+
+
+def _compiled_filter_resample():
+    """Return :func:`_filter_resample` compiled by :mod:`numba`, which is imported and compiled at the first call in the process. If :mod:`numba` is installed but can't be imported, :data:`HAS_NUMBA` is set to :code:`False` and :code:`None` is returned, so that the data is resampled by numpy."""
+    global _filter_resample_jit, HAS_NUMBA
+
+    # fastmath is left off since it assumes no NaN in the data
+    if _filter_resample_jit is None:
+        # e.g. numba built against another numpy version refuses to be imported
+        try:
+            import numba
+
+        except ImportError:
+            HAS_NUMBA = False
+            return None
+
+        _filter_resample_jit = numba.njit(cache=True)(_filter_resample)
+
+    return _filter_resample_jit
+
+
+class GaitBatch(object):
+    """Parameters of all gaits in a data batch, stored as one :class:`numpy.ndarray` per parameter.
+
+    Parameters
+    ---
+    gait_num
+        the number of gaits.
+    values
+        :class:`dict` of parameter data arrays in the shape of :code:`(gait_num, sub_param_num, data_length)`. Shorter pieces of data are padded with :code:`NaN` at the end.
+    lengths
+        :class:`dict` of integer arrays in the shape of :code:`(gait_num, sub_param_num)`, storing the valid length of each piece of data.
+    sub_param_index
+        :class:`dict` mapping every parameter's sub-parameter names to their indexes along the second axis of its data array.
+
+    Note
+    ---
+    `Class Attributes`
+
+    self.gait_num
+        :class:`int` the number of gaits.
+    self.values
+        :class:`dict` of parameter data arrays in the shape of :code:`(gait_num, sub_param_num, data_length)`.
+    self.lengths
+        :class:`dict` of valid data lengths in the shape of :code:`(gait_num, sub_param_num)`.
+    self.sub_param_index
+        :class:`dict` of sub-parameter indexes, e.g. :code:`self.sub_param_index['LAnkleAngles']['X']`.
+
+    Example
+    ---
+    A parameter's data array is retrieved by its name, while a gait is retrieved by its index, in the same layout as a list of dictionary: ::
+
+        batch['LAnkleAngles'][gait_idx, batch.sub_param_index['LAnkleAngles']['X']]
+        batch[gait_idx]['LAnkleAngles']['X']
+    """
+    def __init__(self, gait_num: int, values: dict, lengths: dict, sub_param_index: dict):
+        self.gait_num = gait_num
+        self.values = values
+        self.lengths = lengths
+        self.sub_param_index = sub_param_index
+
+    def __len__(self) -> int:
+        return self.gait_num
+
+    def __getitem__(self, key: Union[str, int, slice]) -> Union[np.ndarray, _GaitView, list]:
+        if isinstance(key, str):
+            return self.values[key]
+
+        # a slice of gaits is a list of gaits, as the list of dictionary does
+        if isinstance(key, slice):
+            return [_GaitView(self, m) for m in range(self.gait_num)[key]]
+
+        return _GaitView(self, range(self.gait_num)[key])
+
+    def __iter__(self) -> Iterable[_GaitView]:
+        for m in range(self.gait_num):
+            yield _GaitView(self, m)
+
+
+class _GaitView(Mapping):
+    """Read-only view of a gait in a :class:`GaitBatch`, mapping parameter names to dictionaries of sub-parameter data. The data are read-only views of the batch's arrays, which can be modified via :attr:`GaitBatch.values`."""
+    def __init__(self, batch: GaitBatch, gait_idx: int):
+        self.batch = batch
+        self.gait_idx = gait_idx
+
+    def __getitem__(self, param_name: str) -> dict:
+        value = self.batch.values[param_name][self.gait_idx]
+        length = self.batch.lengths[param_name][self.gait_idx]
+        sub_params = {}
+
+        # the views share the batch's data arrays, so they're made read-only
+        for sub_param_name, k in self.batch.sub_param_index[param_name].items():
+            sub_params[sub_param_name] = value[k, :length[k]]
+            sub_params[sub_param_name].flags.writeable = False
+
+        return sub_params
+
+    def __contains__(self, param_name: str) -> bool:
+        # a plain dictionary lookup, instead of building the sub-parameter dictionary as Mapping does
+        return param_name in self.batch.sub_param_index
+
+    def __iter__(self) -> Iterable[str]:
+        return iter(self.batch.sub_param_index)
+
+    def __len__(self) -> int:
+        return len(self.batch.sub_param_index)
+
+
+def _read_csv(file, **kwargs) -> pd.DataFrame:
+    """Read a :code:`.csv` file with the multi-threaded pyarrow engine of :func:`pandas.read_csv`, or the C engine if pyarrow isn't installed or fails to parse it."""
+    try:
+        return pd.read_csv(file, engine='pyarrow', **kwargs)
+
+    except (ImportError, pd.errors.ParserError):
+        file.seek(0)
+        return pd.read_csv(file, engine='c', **kwargs)
+
+
+def df_match_indexes(df: Union[pd.DataFrame, np.ndarray], symbol: str) -> tuple:
     """Get the indexes of matched cells of a :mod:`pandas` data frame.
     
     Parameters
     ---
     df
-        :mod:`pandas` data frame.
+        :mod:`pandas` data frame, or its :mod:`numpy` array returned by :meth:`pandas.DataFrame.to_numpy`.
     symbol
         the string to be matched.
 
@@ -234,13 +617,49 @@ def df_match_indexes(df: pd.DataFrame, symbol: str) -> tuple:
     indexes = np.where(df == symbol)
     return indexes
 
-def df_first_match_index(df: pd.DataFrame, symbol: str) -> tuple:
+def df_match_col0(df: Union[pd.DataFrame, np.ndarray], symbol: str) -> np.ndarray:
+    """Get the row indexes of matched cells in the 1st column of a :mod:`pandas` data frame, where the batch names are listed.
+
+    Parameters
+    ---
+    df
+        :mod:`pandas` data frame, or its :mod:`numpy` array returned by :meth:`pandas.DataFrame.to_numpy`.
+    symbol
+        the string to be matched.
+
+    Returns
+    ---
+    :class:`numpy.ndarray`
+        the matched cells' row indexes.
+    """
+    return np.flatnonzero(np.asarray(df)[:, 0] == symbol)
+
+
+def df_match_col2(df: Union[pd.DataFrame, np.ndarray], symbol: str) -> np.ndarray:
+    """Get the row indexes of matched cells in the 3rd column of a :mod:`pandas` data frame, where the event names are listed.
+
+    Parameters
+    ---
+    df
+        :mod:`pandas` data frame, or its :mod:`numpy` array returned by :meth:`pandas.DataFrame.to_numpy`.
+    symbol
+        the string to be matched.
+
+    Returns
+    ---
+    :class:`numpy.ndarray`
+        the matched cells' row indexes.
+    """
+    return np.flatnonzero(np.asarray(df)[:, 2] == symbol)
+
+
+def df_first_match_index(df: Union[pd.DataFrame, np.ndarray], symbol: str) -> tuple:
     """Get the first matched cell's index from a :mod:`pandas` data frame.
     
     Parameters
     ---
     df
-        :mod:`pandas` data frame.
+        :mod:`pandas` data frame, or its :mod:`numpy` array returned by :meth:`pandas.DataFrame.to_numpy`.
     symbol
         the string to be matched.
 
@@ -253,13 +672,13 @@ def df_first_match_index(df: pd.DataFrame, symbol: str) -> tuple:
     return (indexes[0][0], indexes[1][0])
 
 
-def df_first_match_row(df: pd.DataFrame, symbol: str) -> int:
+def df_first_match_row(df: Union[pd.DataFrame, np.ndarray], symbol: str) -> int:
     """Get the first matched cell's row index from a :mod:`pandas` data frame.
     
     Parameters
     ---
     df
-        :mod:`pandas` data frame.
+        :mod:`pandas` data frame, or its :mod:`numpy` array returned by :meth:`pandas.DataFrame.to_numpy`.
     symbol
         the string to be matched.
 
@@ -272,13 +691,13 @@ def df_first_match_row(df: pd.DataFrame, symbol: str) -> int:
     return index[0]
 
 
-def df_first_match_col(df: pd.DataFrame, symbol: str) -> int:
+def df_first_match_col(df: Union[pd.DataFrame, np.ndarray], symbol: str) -> int:
     """Get the first matched cell's column index from a :mod:`pandas` data frame.
     
     Parameters
     ---
     df
-        :mod:`pandas` data frame.
+        :mod:`pandas` data frame, or its :mod:`numpy` array returned by :meth:`pandas.DataFrame.to_numpy`.
     symbol
         the string to be matched.
 
@@ -316,10 +735,15 @@ def load(folder: str, batches: str, vicon_data_class: Type[ViconData], **kwargs)
     Attention
     ---
     At current stage, conditions like :code:`fast walking 1` and :code:`fast walking 2` are identified as two different conditions. In the future, a 'trail' level may be added to the dictionary structure, with extended node tree mechanism developed in :mod:`pedarProbe`.
+
+    Note
+    ---
+    The documents are loaded in parallel worker processes, therefore :attr:`vicon_data_class` must be importable from a module, and scripts calling :func:`load` need the :code:`if __name__ == '__main__':` guard on platforms that spawn processes, e.g. Windows and macOS.
     """
     folders = os.listdir(folder)
     folders.sort()
     subjects = {}
+    tasks = []
 
     for name in folders:  
         if '.DS_Store' in name:
@@ -332,12 +756,56 @@ def load(folder: str, batches: str, vicon_data_class: Type[ViconData], **kwargs)
         files.sort()
 
         for file in files:
-            if '.DS_Store' in file:
+            if '.DS_Store' in file or file.endswith(CACHE_SUFFIX):
                 continue
 
             condition = re.search('[^.]*', file).group()
             filepath = os.path.join(folder, name, file)
-            subjects[name][condition] = vicon_data_class(path=filepath, batches=batches, **kwargs)
+
+            # reserve the slot so that conditions keep the sorted order
+            subjects[name][condition] = None
+            tasks.append((name, condition, file, filepath))
+
+    # every document is parsed independently, so they are loaded in parallel processes
+    with ProcessPoolExecutor(max_workers=_max_workers(len(tasks))) as executor:
+        futures = {
+            executor.submit(_build, filepath, vicon_data_class, batches, kwargs): (name, condition, file)
+            for name, condition, file, filepath in tasks
+        }
+
+        for future in as_completed(futures):
+            name, condition, file = futures[future]
+            subjects[name][condition] = future.result()
             print('{}/{} has been loaded'.format(name, file))
 
-    return subjects
\ No newline at end of file
+    return subjects
+
+
+def _max_workers(task_num: int) -> int:
+    """Return the number of worker processes for :code:`task_num` independent tasks, i.e. no more than the tasks and CPUs, and the limit of :class:`concurrent.futures.ProcessPoolExecutor` on Windows."""
+    max_workers = min(task_num, os.cpu_count() or 1)
+
+    # ProcessPoolExecutor refuses more than 61 workers on Windows
+    if sys.platform == 'win32':
+        max_workers = min(max_workers, 61)
+
+    return max(max_workers, 1)
+
+
+def _build(path: str, vicon_data_class: Type[ViconData], batches: list, kwargs: dict) -> ViconData:
+    """Initialise a Vicon data class in a worker process of :func:`load`."""
+    return vicon_data_class(path=path, batches=batches, **kwargs)
+
+
+def clear_cache(folder: str):
+    """Remove the cache files saved by :meth:`ViconData.cache_save` of all :code:`.csv` Vicon analysis documents under a folder.
+
+    Parameters
+    ---
+    folder
+        the folder storing all :code:`.csv` Vicon analysis documents, in the same layout as :func:`load`.
+    """
+    for root, dirs, files in os.walk(folder):
+        for file in files:
+            if file.endswith(CACHE_SUFFIX):
+                os.remove(os.path.join(root, file))
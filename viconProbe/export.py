@@ -1,17 +1,29 @@
 from __future__ import annotations
-from typing import Type, Union, Iterable
+from typing import Type, Union, Iterable, Protocol
 
-import xlwt
+import heapq
+import math
+import re
+import zipfile
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from xml.sax.saxutils import escape, quoteattr
 
 from viconProbe import data
 
+class Worksheet(Protocol):
+    """Protocol of the worksheets rendered by :class:`XlsBlock`, e.g. a :mod:`xlwt` worksheet."""
+    def write(self, row: int, col: int, value: Union[str, float]):
+        """Write :code:`value` to the cell at :code:`row` and :code:`col`."""
+
+
 class XlsBlock(object):
-    """Advance block container for :code:`.xls` file writing. It allows a block to contain other blocks as its contents, and the layer of containing relationship is unlimited. In :meth:`render`, the exact writing position of each block is determined.
+    """Advance block container for spreadsheet writing. It allows a block to contain other blocks as its contents, and the layer of containing relationship is unlimited. In :meth:`render`, the exact writing position of each block is determined.
     
     Parameters
     ---
     worksheet
-        the :mod:`xlwt` worksheet to be write.
+        the worksheet to be write, i.e. any :class:`Worksheet` with a :code:`write(row, col, value)` method, e.g. a :mod:`xlwt` worksheet.
     head
         the head title of the block.
     mode
@@ -22,11 +34,13 @@ class XlsBlock(object):
     `Class Attributes`
 
     self.worksheet
-        :class:`xlwt.Worksheet.Worksheet` the :mod:`xlwt` worksheet to be write.
+        the worksheet to be write.
     self.head
         :class:`str` the head title of the block.
-    self.contents
-        :class:`list` a list of :class:`XlsBlock` as the block's content, or a list of data.
+    self.child_blocks
+        :class:`list` a list of :class:`XlsBlock` as the block's content, added by :meth:`add_child`.
+    self.leaf_data
+        :class:`list` a list of data as the block's content, added by :meth:`add_data`. They are rendered after :attr:`child_blocks`.
     self.mode
         :class:`str` the direction of content layout: :code:`right` / :code:`down`.
     self.row
@@ -42,12 +56,24 @@ class XlsBlock(object):
     self.col_end
         :class:`int` ending column of the block. Updated during :meth:`render`.
     """
-    def __init__(self, worksheet: xlwt.Worksheet.Worksheet, head: str, mode: str = 'right'):
+    # a block tree holds a block for every head title, so the attributes are kept in fixed slots instead of a __dict__
+    __slots__ = ('worksheet', 'head', 'child_blocks', 'leaf_data', 'mode', 'row', 'row_start', 'row_end', 'col', 'col_start', 'col_end')
+
+    def __init__(self, worksheet: Worksheet, head: str, mode: str = 'right'):
         self.worksheet = worksheet
         self.head = head
-        self.contents = []
+        self.child_blocks = []
+        self.leaf_data = []
         self.mode = mode
 
+    def add_child(self, block: XlsBlock):
+        """Add a :class:`XlsBlock` to the block's content."""
+        self.child_blocks.append(block)
+
+    def add_data(self, data: Iterable):
+        """Add a list of data to the block's content, which will be written downwards in a column."""
+        self.leaf_data.append(data)
+
     def move(self, row_add: int, col_add: int):
         """Move current writing location by :code:`row_add` and :code:`col_add`."""
         self.row += row_add
@@ -86,7 +112,7 @@ class XlsBlock(object):
             self.col_start = col_new
 
     def render(self, row: int, col: int):
-        """Recursively render the block and its content to the :code:`.xls` file.
+        """Recursively render the block and its content to the worksheet.
         
         Parameters
         ---
@@ -101,30 +127,40 @@ class XlsBlock(object):
         self.worksheet.write(self.row_start, self.col_start, self.head)
         self.move(1, 0)
 
-        for content in self.contents:
-            if type(content) == XlsBlock:
-                content.render(self.row, self.col)
+        for block in self.child_blocks:
+            block.render(self.row, self.col)
+
+            self.update(block.row_start, block.col_start)
+            self.update(block.row_end, block.col_end)
+
+            if self.mode == 'right':
+                self.move_to(self.row_start + 1, self.col_end + 1)
+
+            elif self.mode == 'down':
+                self.move_to(self.row_end, self.col_start)
 
-                self.update(content.row_start, content.col_start)
-                self.update(content.row_end, content.col_end)
+        # the writing location only moves downwards, so the bounds are updated once per column
+        write = self.worksheet.write
 
-                if self.mode == 'right':
-                    self.move_to(self.row_start + 1, self.col_end + 1)
+        for content in self.leaf_data:
+            row, col = self.row, self.col
 
-                elif self.mode == 'down':
-                    self.move_to(self.row_end, self.col_start)
+            for data in content:
+                write(row, col, data)
+                row += 1
 
-            else:
-                for data in content:
-                    self.worksheet.write(self.row, self.col, data)
-                    self.move(1, 0)
+            # a column of data only extends the block downwards, from a location already inside its bounds
+            self.row = row
 
+            if row > self.row_end:
+                self.row_end = row
 
-def export_gait_attrs(subjects: dict, batch: str, params: list, export_folder: str = 'outputs'):
-    """Export the gait parameters data to :code:`.xls` files.
 
-    - Every subject export a :code:`.xls` file.
-    - Every parameter stores in a sheet of the :code:`.xls` file.
+def export_gait_attrs(subjects: dict, batch: str, params: list, export_folder: str = 'outputs', sheets_per_workbook: int = None):
+    """Export the gait parameters data to :code:`.xlsx` files.
+
+    - Every subject export a :code:`.xlsx` file.
+    - Every parameter stores in a sheet of the :code:`.xlsx` file, or the parameters are stacked downwards in :attr:`sheets_per_workbook` sheets.
     - In every sheet, data is arranged in the form of:
 
     .. list-table:: Data Sheet Format
@@ -236,39 +272,391 @@ def export_gait_attrs(subjects: dict, batch: str, params: list, export_folder: s
 
         Note
         ---
-        The exported file is named and stored as :code:`<export_folder>/<batch_name>.xls`.
+        The exported file is named and stored as :code:`<export_folder>/<subject_name> - <batch_name>.xlsx`.
+    sheets_per_workbook
+        the number of sheets in every :code:`.xlsx` file. Defaults to :code:`None`, i.e. a sheet for every parameter, named by the parameter. Otherwise, the parameters are split into :attr:`sheets_per_workbook` groups in order, and every group's parameter blocks are stacked downwards in a sheet named :code:`Sheet <n>`. If there are fewer parameters than :attr:`sheets_per_workbook`, every parameter gets a sheet.
+
+    Raises
+    ---
+    ValueError
+        if :attr:`params` is empty, :attr:`sheets_per_workbook` is smaller than :code:`1`, or a parameter isn't a valid sheet name when it names a sheet, i.e. longer than 31 characters, containing :code:`[ ] : * ? / \\`, or duplicated.
+
+    Note
+    ---
+    The subjects are exported in parallel worker processes, therefore scripts calling :func:`export_gait_attrs` need the :code:`if __name__ == '__main__':` guard on platforms that spawn processes, e.g. Windows and macOS.
+    """
+    # a workbook without any sheet is deemed corrupted
+    if not params:
+        raise ValueError("no parameter to be exported")
+
+    if sheets_per_workbook is not None and sheets_per_workbook < 1:
+        raise ValueError("sheets_per_workbook must be at least 1, got {}".format(sheets_per_workbook))
+
+    # the parameters name the sheets, so they are checked before any worker starts
+    if sheets_per_workbook is None:
+        _check_sheet_names(params)
+
+    # every subject's workbook is independent, so they are exported in parallel processes
+    with ProcessPoolExecutor(max_workers=data._max_workers(len(subjects))) as executor:
+        futures = [
+            executor.submit(
+                _export_one_subject, name,
+                {condition: subjects[name][condition].attrs[batch] for condition in subjects[name]},
+                batch, params, export_folder, sheets_per_workbook,
+            )
+            for name in subjects
+        ]
+
+        for future in as_completed(futures):
+            print('/{} has been outputed'.format(future.result()))
+
+
+def _export_one_subject(name: str, subject_data: dict, batch: str, params: list, export_folder: str, sheets_per_workbook: int = None) -> str:
+    """Export a subject's :code:`.xlsx` file in a worker process of :func:`export_gait_attrs`.
+
+    Parameters
+    ---
+    name
+        the subject name.
+    subject_data
+        :class:`dict` of the subject's exported batch in each condition, i.e. :code:`subject_data[condition]` is :code:`subjects[name][condition].attrs[batch]`. Only the exported batch is sent to the worker process.
+    batch
+        name of the data batch to be exported.
+    params
+        a list of selected parameter list.
+    export_folder
+        the export folder.
+    sheets_per_workbook
+        the number of sheets in the :code:`.xlsx` file, or :code:`None` for a sheet for every parameter.
+
+    Returns
+    ---
+    :class:`str`
+        path of the exported file.
+    """
+    gait_labels = _gait_labels(max((len(data) for data in subject_data.values()), default=0))
+    sheets = []
+
+    # every parameter's sheet walks the same batches of the subject's conditions
+    cond_data = [(_s(condition), data) for condition, data in subject_data.items()]
+
+    if sheets_per_workbook is None:
+        groups = [[param] for param in params]
+
+    else:
+        # balanced split, the first groups take one more parameter when they can't be even
+        group_num = max(min(sheets_per_workbook, len(params)), 1)
+        size, extra = divmod(len(params), group_num)
+        bounds = [n * size + min(n, extra) for n in range(group_num + 1)]
+        groups = [params[start:end] for start, end in zip(bounds, bounds[1:]) if end > start]
+
+    for sheet_num, group in enumerate(groups, 1):
+        sheet_name = group[0] if sheets_per_workbook is None else 'Sheet {}'.format(sheet_num)
+        sheets.append((sheet_name, _sheet_cells(name, group, cond_data, gait_labels)))
+
+    save_file = "{}/{} - {}.xlsx".format(export_folder, name, batch)
+    _write_xlsx_stream(save_file, sheets)
+    return save_file
+
+
+def _sheet_cells(name: str, group: list, cond_data: list, gait_labels: tuple) -> Iterable[tuple]:
+    """Generate the :code:`(row, col, value)` cells of a subject's sheet in row order, with the blocks of the parameters in :code:`group` stacked downwards.
+
+    Attention
+    ---
+    The layout is only built when the sheet starts to be written by :func:`_write_xlsx_stream`, therefore only a sheet's layout and data are held in memory at a time."""
+    runs = []
+    row = 0
+
+    # the parameter blocks of a sheet are stacked downwards, as the 'down' mode of XlsBlock
+    for param in group:
+        param_node = _param_node(name, param, cond_data, gait_labels)
+
+        # measure all blocks first, then write the cells in a single sweep
+        layouts = {}
+        height, width = _measure(param_node, layouts)
+        _emit(param_node, row, 0, layouts, runs)
+        row += height
+
+    yield from heapq.merge(*runs)
+
+
+def _param_node(name: str, param: str, cond_data: list, gait_labels: tuple) -> _LayoutNode:
+    """Build the layout tree of a parameter's block in a subject's sheet, from the :code:`(condition, batch data)` pairs of the subject."""
+    subject_node = _LayoutNode(_s(name), 'down', [])
+    param_node = _LayoutNode(_s(param), 'right', [subject_node])
+
+    for condition, data in cond_data:
+        condition_node = _LayoutNode(condition, 'right', [])
+        subject_node.children.append(condition_node)
+
+        # all gaits of a batch share the same sub-parameters, so a missing parameter is found once per condition
+        if param not in data.sub_param_index:
+            print("Warning: {} - {} - {} not found".format(name, condition, param))
+            # only the gait head titles are left, as empty leaves instead of gait blocks
+            condition_node.children.extend((gait_labels[gait_num], ()) for gait_num in range(len(data)))
+            continue
+
+        sub_params = [(_s(sub_param), k) for sub_param, k in data.sub_param_index[param].items()]
+        # the whole data array is converted to Python floats in a single call, instead of one call per column
+        value, length = data.values[param].tolist(), data.lengths[param].tolist()
+
+        for gait_num in range(len(data)):
+            gait_node = _LayoutNode(gait_labels[gait_num], 'right', [])
+            condition_node.children.append(gait_node)
+
+            for sub_param, k in sub_params:
+                gait_node.children.append((sub_param, value[gait_num][k][:length[gait_num][k]]))
+
+    return param_node
+
+
+_intern = {}
+
+
+def _s(x: str) -> str:
+    """Return the first seen string equal to :code:`x`, so that the repeated header strings of a workbook share the same object."""
+    return _intern.setdefault(x, x)
+
+
+_GAIT_LABELS = tuple(_s('Gait ' + str(gait_num)) for gait_num in range(256))
+
+
+def _gait_labels(gait_num: int) -> tuple:
+    """Return the :code:`'Gait <n>'` head titles of at least :code:`gait_num` gaits, extending the module's precomputed labels when there are more gaits."""
+    global _GAIT_LABELS
+
+    if gait_num > len(_GAIT_LABELS):
+        _GAIT_LABELS += tuple(_s('Gait ' + str(n)) for n in range(len(_GAIT_LABELS), gait_num))
+
+    return _GAIT_LABELS
+
+
+_LayoutNode = namedtuple('_LayoutNode', 'head mode children')
+_LayoutNode.__doc__ = """A block in the layout of a worksheet, as :class:`XlsBlock` without its writing states. :code:`children` is a list of :class:`_LayoutNode` or :code:`(head, values)` leaf tuples, i.e. a head cell above a column of values."""
+
+
+def _measure(node: _LayoutNode, layouts: dict) -> tuple:
+    """Recursively measure the size of a layout node with the same rules as :meth:`XlsBlock.render`, without touching the worksheet.
+
+    Parameters
+    ---
+    node
+        the layout node to be measured.
+    layouts
+        :class:`dict` to store every node's layout, keyed by :code:`id(node)`, as :code:`(height, width, child_offsets)`. The offsets are relative to the node's head cell.
+
+    Returns
+    ---
+    :class:`tuple`
+        :code:`(height, width)` of the node, including the trailing writing location as :meth:`XlsBlock.update` does.
+    """
+    row, col = 1, 0
+    row_end, col_end = 1, 0
+    child_offsets = []
+
+    for child in node.children:
+        child_offsets.append((row, col))
+
+        if isinstance(child, _LayoutNode):
+            height, width = _measure(child, layouts)
+
+        else:
+            height, width = _leaf_extent(len(child[1]))
+
+        row_end = max(row_end, row + height)
+        col_end = max(col_end, col + width)
+
+        if node.mode == 'right':
+            row, col = 1, col_end + 1
+            col_end = col
+
+        elif node.mode == 'down':
+            row, col = row_end, 0
+
+    layouts[id(node)] = (row_end, col_end, child_offsets)
+    return row_end, col_end
+
+
+def _leaf_extent(n_values: int) -> tuple:
+    """Return the :code:`(height, width)` of a leaf, i.e. a head cell above a column of :code:`n_values` values, including the trailing writing location as :meth:`XlsBlock.update` does."""
+    return 1 + n_values, 0
+
+
+def _emit(node: _LayoutNode, row: int, col: int, layouts: dict, out: list):
+    """Recursively append the cells of a layout node measured by :func:`_measure` to :code:`out`, with its head cell at :code:`row` and :code:`col`. The cells are appended as runs of :code:`(row, col, value)`, and every run is in row order, so :func:`heapq.merge` streams the whole sheet in row order without sorting it."""
+    height, width, child_offsets = layouts[id(node)]
+    out.append(((row, col, node.head),))
+
+    for child, (row_offset, col_offset) in zip(node.children, child_offsets):
+        if isinstance(child, _LayoutNode):
+            _emit(child, row + row_offset, col + col_offset, layouts, out)
+
+        else:
+            head, values = child
+            out.append(((row + row_offset, col + col_offset, head),))
+
+            if values:
+                out.append(_column(row + row_offset + 1, col + col_offset, values))
+
+
+def _column(row: int, col: int, values: Iterable) -> Iterable[tuple]:
+    """Generate the :code:`(row, col, value)` cells of a column of values written downwards from :code:`row` and :code:`col`."""
+    for n, value in enumerate(values, row):
+        yield n, col, value
+
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '{}</Types>'
+)
+_CONTENT_TYPE_SHEET = '<Override PartName="/xl/worksheets/sheet{}.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+
+_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets>{}</sheets></workbook>'
+)
+_WORKBOOK_SHEET = '<sheet name={} sheetId="{}" r:id="rId{}"/>'
+
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">{}</Relationships>'
+)
+_WORKBOOK_RELS_SHEET = '<Relationship Id="rId{}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet{}.xml"/>'
+
+_SHEET_START = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_END = b'</sheetData></worksheet>'
+
+
+def _write_xlsx_stream(path: str, sheets: list):
+    """Write worksheets to a :code:`.xlsx` file, by streaming the spreadsheet XML into the zip archive directly.
+
+    - Numbers are written as numeric cells. :code:`NaN` and infinite values are left empty, since they can't be stored in a :code:`.xlsx` file.
+    - Strings are written as inline strings, skipping the shared strings table.
+
+    Parameters
+    ---
+    path
+        path of the :code:`.xlsx` file.
+    sheets
+        a list of :code:`(sheet_name, cells)` tuples, where :code:`cells` is an iterable of :code:`(row, col, value)` already in row order without repeated cells, e.g. from :func:`_sheet_cells`. An iterable is consumed while the sheet is written, so only a row of XML is held at a time.
+
+    Raises
+    ---
+    ValueError
+        if there isn't any sheet, or a sheet name is invalid in a spreadsheet, as checked by :func:`_check_sheet_names`. It's raised before the file is created.
+    """
+    _check_sheet_names([sheet_name for sheet_name, cells in sheets])
+
+    # the XML of every header string is only built once
+    strings = {}
+    # the letters of every column are only built once, and every cell is formatted with a single operation
+    col_refs = {}
+    isfinite = math.isfinite
+
+    # the compressed parts are written in small pieces, so the file is opened with a 1 MiB buffer
+    with open(path, 'wb', buffering=1 << 20) as output, zipfile.ZipFile(output, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml', _CONTENT_TYPES.format(''.join(
+            _CONTENT_TYPE_SHEET.format(n) for n in range(1, len(sheets) + 1)
+        )))
+        zf.writestr('_rels/.rels', _RELS)
+        zf.writestr('xl/workbook.xml', _WORKBOOK.format(''.join(
+            _WORKBOOK_SHEET.format(quoteattr(sheet_name), n, n) for n, (sheet_name, cells) in enumerate(sheets, 1)
+        )))
+        zf.writestr('xl/_rels/workbook.xml.rels', _WORKBOOK_RELS.format(''.join(
+            _WORKBOOK_RELS_SHEET.format(n, n) for n in range(1, len(sheets) + 1)
+        )))
+
+        for n, (sheet_name, cells) in enumerate(sheets, 1):
+            with zf.open('xl/worksheets/sheet{}.xml'.format(n), 'w', force_zip64=True) as file:
+                file.write(_SHEET_START)
+                row_now = None
+                xml = []
+                append = xml.append
+
+                # cells must be written row by row, from left to right
+                for row, col, value in cells:
+                    if row != row_now:
+                        if row_now is not None:
+                            append('</row>')
+                            file.write(''.join(xml).encode())
+                            xml.clear()
+
+                        row_ref = str(row + 1)
+                        append('<row r="{}">'.format(row_ref))
+                        row_now = row
+
+                    if col not in col_refs:
+                        col_refs[col] = _col_ref(col)
+
+                    if isinstance(value, str):
+                        if value not in strings:
+                            strings[value] = '" t="inlineStr"><is><t xml:space="preserve">{}</t></is></c>'.format(escape(value))
+
+                        append('<c r="' + col_refs[col] + row_ref + strings[value])
+
+                    elif isfinite(value):
+                        append('<c r="%s%s"><v>%r</v></c>' % (col_refs[col], row_ref, float(value)))
+
+                if row_now is not None:
+                    xml.append('</row>')
+                    file.write(''.join(xml).encode())
+
+                file.write(_SHEET_END)
+
+
+_INVALID_SHEET_NAME_CHARS = re.compile(r'[\[\]:*?/\\]')
+
+
+def _check_sheet_names(sheet_names: list):
+    """Check the sheet names of a workbook with the same rules as :mod:`xlwt`, which are required by spreadsheet applications, otherwise the file is deemed corrupted.
+
+    - A name has 1 to 31 characters, without :code:`[ ] : * ? / \\`, and doesn't begin or end with :code:`'`.
+    - Names are unique in a workbook, regardless of case.
+    - A workbook has at least a sheet.
+
+    Raises
+    ---
+    ValueError
+        if a sheet name is invalid or duplicated, or there isn't any sheet.
     """
-    for name in subjects:
-        workbook = xlwt.Workbook(encoding='ascii')
+    if not sheet_names:
+        raise ValueError("a workbook needs at least one worksheet")
 
-        for param in params:
-            worksheet = workbook.add_sheet(param, cell_overwrite_ok=True)
+    seen = set()
 
-            param_batch = XlsBlock(worksheet, param)
-            subject_batch = XlsBlock(worksheet, name)
-            subject_batch.mode = 'down'
-            param_batch.contents.append(subject_batch)
+    for sheet_name in sheet_names:
+        if not 1 <= len(sheet_name) <= 31 or _INVALID_SHEET_NAME_CHARS.search(sheet_name) or sheet_name[0] == "'" or sheet_name[-1] == "'":
+            raise ValueError("invalid worksheet name {!r}".format(sheet_name))
 
-            for condition in subjects[name]:
-                condition_batch = XlsBlock(worksheet, condition)
-                subject_batch.contents.append(condition_batch)
-                data = subjects[name][condition].attrs[batch]
+        if sheet_name.lower() in seen:
+            raise ValueError("duplicate worksheet name {!r}".format(sheet_name))
 
-                for gait_num in range(len(data)):
-                    gait_batch = XlsBlock(worksheet, 'Gait ' + str(gait_num))
-                    condition_batch.contents.append(gait_batch)
+        seen.add(sheet_name.lower())
 
-                    if param not in data[gait_num].keys():
-                        print("Warning: {} - {} - {} not found".format(name, condition, param))
 
-                    else:
-                        for sub_param in data[gait_num][param]:
-                            sub_param_batch = XlsBlock(worksheet, sub_param)
-                            gait_batch.contents.append(sub_param_batch)
-                            sub_param_batch.contents.append(data[gait_num][param][sub_param])
+def _col_ref(col: int) -> str:
+    """Transform a column index to its letters in the spreadsheet cell reference, e.g. :code:`0` to :code:`A`, :code:`26` to :code:`AA`."""
+    letters = ''
+    col += 1
 
-            param_batch.render(0, 0)
+    while col:
+        col, remainder = divmod(col - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
 
-        save_file = "{}/{} - {}.xls".format(export_folder, name, batch)
-        workbook.save(save_file)
-        print('/{} has been outputed'.format(save_file))
\ No newline at end of file
+    return letters
\ No newline at end of file